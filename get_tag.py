@@ -1,22 +1,48 @@
 #!/usr/bin/env python3
 
 import argparse
+import base64
+import concurrent.futures
 import datetime
+import functools
+import gzip
+import hashlib
 import http.client
+import io
 import json
+import math
 import os
+import pathlib
+import random
 import re
+import ssl
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+import urllib.error
+import urllib.parse
 import urllib.request
+import zlib
 
 _RETRIES = 3
+_BACKOFF_MAX = 60
+_RATE_LIMIT_MAX = 300
+_REDIRECTS = 5
+_TIMEOUT = 30
+_HEADERS = {"User-Agent": "get-tag", "Accept-Encoding": "gzip, deflate"}
+_WORKERS = 20
+_CACHE = os.environ.get("GET_TAG_CACHE", "~/.cache/get-tag")
+_CACHE_DIR = pathlib.Path(_CACHE).expanduser() if _CACHE else None
+_CACHE_TTL = 300
+_CACHE_TTL_GL_PROJECT = 7 * 24 * 60 * 60
 _SEP_BRANCH = ":"
 _SEP_BASE = "@"
 _DEFAULT_BRANCH = ""
 _DEFAULT_GH_BASE = "https://api.github.com"
 _DEFAULT_GL_BASE = "https://gitlab.com"
+_PER_PAGE = 100
 _CR_COICES = {
     "hourly": "%Y-%m-%dT%H",
     "daily": "%Y-%m-%d",
@@ -25,27 +51,252 @@ _CR_COICES = {
     "yearly": "%Y",
 }
 _CR_COICES["annually"] = _CR_COICES["yearly"]
+_RE_PIP_VERSIONS = re.compile(r"\(from versions: (.*)\)")
+_NPM_HEADERS = {"Accept": "application/vnd.npm.install-v1+json"}
+
+
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.minimum_version = ssl.TLSVersion.TLSv1_2
+_SSL_SESSIONS: dict[str, ssl.SSLSession] = {}
+_POOL: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+_POOL_LOCK = threading.Lock()
+
+
+class _Response(io.BytesIO):
+    def __init__(self, status: int, headers: http.client.HTTPMessage, body: bytes):
+        super().__init__(body)
+        self.status = status
+        self.headers = headers
+
+
+class _HTTPSConnection(http.client.HTTPSConnection):
+    def __init__(self, host: str, timeout: float):
+        super().__init__(host, timeout=timeout, context=_SSL_CONTEXT)
+        self._server_hostname = ""
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+        self._server_hostname = self._tunnel_host or self.host
+        self.sock = self._context.wrap_socket(
+            self.sock,
+            server_hostname=self._server_hostname,
+            session=_SSL_SESSIONS.get(self._server_hostname),
+        )
+
+    def getresponse(self) -> http.client.HTTPResponse:
+        response = super().getresponse()
+        # TLS 1.3 tickets arrive after the handshake, so remember the session here
+        if self.sock and self.sock.session:
+            _SSL_SESSIONS[self._server_hostname] = self.sock.session
+        return response
 
 
-def _urlopen(url: str, __retries: int = _RETRIES) -> http.client.HTTPResponse:
-    if _RETRIES == __retries:
-        print(f"{url=}", file=sys.stderr)
+def _connect(scheme: str, netloc: str) -> http.client.HTTPConnection:
+    proxy = urllib.request.getproxies().get(scheme)
+    if proxy and urllib.request.proxy_bypass(netloc):
+        proxy = None
+    if not proxy:
+        host = netloc
+    else:
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        parts = urllib.parse.urlsplit(proxy)
+        host = f"{parts.hostname}:{parts.port}" if parts.port else parts.hostname
+    if "https" == scheme:
+        connection = _HTTPSConnection(host, _TIMEOUT)
+    else:
+        connection = http.client.HTTPConnection(host, timeout=_TIMEOUT)
+    if proxy:
+        tunnel_headers = {}
+        if parts.username is not None:
+            credentials = ":".join(
+                urllib.parse.unquote(credential or "")
+                for credential in (parts.username, parts.password)
+            )
+            authorization = base64.b64encode(credentials.encode()).decode()
+            tunnel_headers["Proxy-Authorization"] = f"Basic {authorization}"
+        connection.set_tunnel(netloc, headers=tunnel_headers)
+    return connection
+
+
+def _acquire(scheme: str, netloc: str) -> tuple[http.client.HTTPConnection, bool]:
+    with _POOL_LOCK:
+        idle = _POOL.get((scheme, netloc))
+        if idle:
+            return idle.pop(), True
+    return _connect(scheme, netloc), False
+
+
+def _release(scheme: str, netloc: str, connection: http.client.HTTPConnection):
+    with _POOL_LOCK:
+        _POOL.setdefault((scheme, netloc), []).append(connection)
+
+
+def _decompress(body: bytes, encoding: str) -> bytes:
+    if "gzip" == encoding:
+        return gzip.decompress(body)
+    if "deflate" == encoding:
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def _request(url: str, headers: dict[str, str] | None = None) -> _Response:
+    headers = _HEADERS | (headers or {})
+    for _ in range(_REDIRECTS + 1):
+        scheme, netloc, path, query, _ = urllib.parse.urlsplit(url)
+        target = f"{path or '/'}?{query}" if query else path or "/"
+        connection, reused = _acquire(scheme, netloc)
+        try:
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError):
+                # idle keep-alive connection closed by the server, reconnect once
+                connection.close()
+                if not reused:
+                    raise
+                connection = _connect(scheme, netloc)
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+            body = response.read()
+        except BaseException:
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            _release(scheme, netloc, connection)
+        location = response.headers.get("Location")
+        if response.status in (301, 302, 303, 307, 308) and location:
+            url = urllib.parse.urljoin(url, location)
+            if urllib.parse.urlsplit(url).netloc != netloc:
+                # never forward credentials to a different host
+                headers = {
+                    key: value
+                    for key, value in headers.items()
+                    if "authorization" != key.lower()
+                }
+            continue
+        body = _decompress(body, response.headers.get("Content-Encoding", ""))
+        return _Response(response.status, response.headers, body)
+    raise http.client.HTTPException(f"too many redirects: {url}")
+
+
+def _cache_path(key: str, suffix: str) -> pathlib.Path:
+    assert _CACHE_DIR is not None
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return _CACHE_DIR / f"{digest}{suffix}"
+
+
+def _cache_get(key: str, ttl: float, suffix: str = ".body") -> bytes | None:
+    if _CACHE_DIR is None:
+        return None
+    path = _cache_path(key, suffix)
     try:
-        response = urllib.request.urlopen(url)
-        assert 200 == response.status
-        return response
-    except Exception:
-        if __retries:
-            sleep = 30 * (_RETRIES - __retries + 1)
-            print(f"{sleep=}", file=sys.stderr)
-            time.sleep(sleep)
-            return _urlopen(url, __retries - 1)
-        raise
+        if time.time() - path.stat().st_mtime < ttl:
+            return path.read_bytes()
+    except OSError:
+        pass
+    return None
+
+
+def _cache_put(key: str, data: bytes, suffix: str = ".body"):
+    if _CACHE_DIR is None:
+        return
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=_CACHE_DIR, delete=False) as file:
+            file.write(data)
+        os.replace(file.name, _cache_path(key, suffix))
+    except OSError:
+        pass
+
+
+def _cache_delete(key: str, suffix: str = ".body"):
+    if _CACHE_DIR is None:
+        return
+    try:
+        _cache_path(key, suffix).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _get_rate_limit_sleep(headers: http.client.HTTPMessage) -> float | None:
+    retry_after = headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    reset = headers.get("X-RateLimit-Reset", "")
+    if "0" == headers.get("X-RateLimit-Remaining") and reset.isdigit():
+        return max(0.0, float(reset) - time.time()) + 1
+    return None
+
+
+def _urlopen(url: str, headers: dict[str, str] | None = None) -> _Response:
+    print(f"{url=}", file=sys.stderr)
+    if (cached := _cache_get(url, _CACHE_TTL)) is not None:
+        return _Response(200, http.client.HTTPMessage(), cached)
+    stale = None
+    if etag := _cache_get(url, math.inf, ".etag"):
+        stale = _cache_get(url, math.inf)
+        if stale is not None:
+            headers = (headers or {}) | {"If-None-Match": etag.decode()}
+    for attempt in range(_RETRIES + 1):
+        sleep = min(_BACKOFF_MAX, 2**attempt + random.random())
+        try:
+            response = _request(url, headers)
+        except (http.client.HTTPException, OSError):
+            if _RETRIES == attempt:
+                raise
+        else:
+            if 304 == response.status and stale is not None:
+                _cache_put(url, stale)
+                return _Response(200, response.headers, stale)
+            if 200 == response.status:
+                _cache_put(url, response.getvalue())
+                if etag := response.headers.get("ETag"):
+                    _cache_put(url, etag.encode(), ".etag")
+                else:
+                    _cache_delete(url, ".etag")
+                return response
+            reason = http.client.responses.get(response.status, "")
+            error = urllib.error.HTTPError(
+                url, response.status, reason, response.headers, None
+            )
+            rate_limit_sleep = _get_rate_limit_sleep(response.headers)
+            if rate_limit_sleep is not None:
+                if rate_limit_sleep > _RATE_LIMIT_MAX:
+                    raise error
+                sleep = rate_limit_sleep
+            elif response.status < 500 and 429 != response.status:
+                raise error
+            if _RETRIES == attempt:
+                raise error
+        print(f"{sleep=}", file=sys.stderr)
+        time.sleep(sleep)
+    raise AssertionError
+
+
+def _get_reversed(response: _Response, key: str) -> list[str]:
+    return [result[key] for result in reversed(json.loads(response.read()))]
 
 
 def get_pip_versions_1(package: str) -> list[str]:
-    process = subprocess.run(["pip", "install", f"{package}=="], capture_output=True)
-    match = re.search(r"\(from versions: (.*)\)", process.stderr.decode())
+    process = subprocess.run(
+        [
+            "pip",
+            "install",
+            "--disable-pip-version-check",
+            "--no-cache-dir",
+            "--dry-run",
+            f"{package}==",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    match = _RE_PIP_VERSIONS.search(process.stderr.decode())
     assert match
     return match.group(1).split(", ")
 
@@ -54,13 +305,12 @@ def get_pip_versions_2(package: str) -> list[str]:
     url = f"https://pypi.org/pypi/{package}/json"
     response = _urlopen(url)
     releases = json.loads(response.read())["releases"]
-    versions = filter(
-        lambda release: (release := releases[release]) and not release[0]["yanked"],
-        releases,
-    )
-    return sorted(
-        versions, key=lambda release: releases[release][0]["upload_time_iso_8601"]
-    )
+    uploads = {
+        version: files[0]["upload_time_iso_8601"]
+        for version, files in releases.items()
+        if files and not files[0]["yanked"]
+    }
+    return sorted(uploads, key=uploads.__getitem__)
 
 
 def get_pip_versions_3(package: str) -> list[str]:
@@ -79,7 +329,9 @@ def get_pip_version_1(package: str) -> str:
 
 
 def get_pip_version_2(package: str) -> str:
-    return get_pip_versions_2(package)[-1]
+    url = f"https://pypi.org/pypi/{package}/json"
+    response = _urlopen(url)
+    return json.loads(response.read())["info"]["version"]
 
 
 def get_pip_version_3(package: str) -> str:
@@ -88,11 +340,16 @@ def get_pip_version_3(package: str) -> str:
 
 def get_pip_version_4(package: str) -> str:
     subprocess.check_call(["pip", "install", "--upgrade", package])
-    process = subprocess.run(["pip", "freeze"], capture_output=True, check=True)
     startswith = f"{package}=="
-    for frozen in process.stdout.decode().splitlines():
-        if frozen.startswith(startswith):
-            return frozen[len(startswith) :]
+    process = subprocess.Popen(["pip", "freeze"], stdout=subprocess.PIPE, text=True)
+    with process:
+        assert process.stdout
+        for frozen in process.stdout:
+            if frozen.startswith(startswith):
+                process.terminate()
+                return frozen[len(startswith) :].rstrip("\n")
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, process.args)
     raise AssertionError
 
 
@@ -102,19 +359,13 @@ def get_pip_version(package: str) -> str:
 
 def get_npm_versions_1(package: str) -> list[str]:
     url = f"https://registry.npmjs.org/{package}"
-    response = _urlopen(url)
+    response = _urlopen(url, headers=_NPM_HEADERS)
     versions = json.loads(response.read())["versions"]
     return list(versions.keys())
 
 
 def get_npm_versions_2(package: str) -> list[str]:
-    process = subprocess.run(
-        ["npm", "show", package, "versions", "--json"],
-        shell=True,
-        capture_output=True,
-        check=True,
-    )
-    return json.loads(process.stdout)
+    return get_npm_versions_1(package)
 
 
 def get_npm_versions(package: str) -> list[str]:
@@ -123,18 +374,12 @@ def get_npm_versions(package: str) -> list[str]:
 
 def get_npm_version_1(package: str) -> str:
     url = f"https://registry.npmjs.org/{package}"
-    response = _urlopen(url)
+    response = _urlopen(url, headers=_NPM_HEADERS)
     return json.loads(response.read())["dist-tags"]["latest"]
 
 
 def get_npm_version_2(package: str) -> str:
-    process = subprocess.run(
-        ["npm", "show", package, "version"],
-        shell=True,
-        capture_output=True,
-        check=True,
-    )
-    return process.stdout.decode().strip()
+    return get_npm_version_1(package)
 
 
 def get_npm_version(package: str) -> str:
@@ -144,12 +389,17 @@ def get_npm_version(package: str) -> str:
 def get_go_versions_1(module: str) -> list[str]:
     url = f"https://proxy.golang.org/{module}/@v/list"
     response = _urlopen(url)
-    versions: list[dict[str, str]] = []
-    for version in response.read().decode().splitlines():
-        url_version = f"https://proxy.golang.org/{module}/@v/{version}.info"
-        response_version = _urlopen(url_version)
-        versions.append(json.loads(response_version.read()))
-    raise NotImplementedError
+    urls = [
+        f"https://proxy.golang.org/{module}/@v/{version}.info"
+        for version in response.read().decode().splitlines()
+    ]
+    with concurrent.futures.ThreadPoolExecutor(_WORKERS) as executor:
+        versions: list[dict[str, str]] = [
+            json.loads(response_version.read())
+            for response_version in executor.map(_urlopen, urls)
+        ]
+    versions.sort(key=lambda version: version["Time"])
+    return [version["Version"] for version in versions]
 
 
 def get_go_versions_2(module: str) -> list[str]:
@@ -202,33 +452,33 @@ def _get_gh_repository_base(repository: str) -> tuple[str, str]:
     return _get_repository_base(repository, _DEFAULT_GH_BASE)
 
 
-def get_gh_commits(repository: str) -> list[str]:
+def get_gh_commits(repository: str, limit: int = _PER_PAGE) -> list[str]:
     repository, base = _get_gh_repository_base(repository)
     repository, branch = _get_repository_branch(repository)
     repository, path = _get_repository_path(repository)
-    url = f"{base}/repos/{repository}/commits?sha={branch}&path={path}"
+    url = f"{base}/repos/{repository}/commits?sha={branch}&path={path}&per_page={limit}"
     response = _urlopen(url)
-    return [result["sha"] for result in reversed(json.loads(response.read()))]
+    return _get_reversed(response, "sha")
 
 
 def get_gh_commit(repository: str) -> str:
-    return get_gh_commits(repository)[-1]
+    return get_gh_commits(repository, 1)[-1]
 
 
-def get_gh_tags(repository: str) -> list[str]:
+def get_gh_tags(repository: str, limit: int = _PER_PAGE) -> list[str]:
     repository, base = _get_gh_repository_base(repository)
-    url = f"{base}/repos/{repository}/tags"
+    url = f"{base}/repos/{repository}/tags?per_page={limit}"
     response = _urlopen(url)
-    return [result["name"] for result in reversed(json.loads(response.read()))]
+    return _get_reversed(response, "name")
 
 
 def get_gh_tag(repository: str) -> str:
-    return get_gh_tags(repository)[-1]
+    return get_gh_tags(repository, 1)[-1]
 
 
-def get_gh_releases_1(repository: str) -> list[str]:
+def get_gh_releases_1(repository: str, limit: int = _PER_PAGE) -> list[str]:
     repository, base = _get_gh_repository_base(repository)
-    url = f"{base}/repos/{repository}/releases"
+    url = f"{base}/repos/{repository}/releases?per_page={limit}"
     response = _urlopen(url)
     return [
         result["tag_name"]
@@ -252,51 +502,56 @@ def get_gh_release(repository: str) -> str:
     return get_gh_release_2(repository)
 
 
-def get_gh_deployments(repository: str) -> list[str]:
+def get_gh_deployments(repository: str, limit: int = _PER_PAGE) -> list[str]:
     repository, base = _get_gh_repository_base(repository)
-    url = f"{base}/repos/{repository}/deployments"
+    url = f"{base}/repos/{repository}/deployments?per_page={limit}"
     response = _urlopen(url)
-    return [result["sha"] for result in reversed(json.loads(response.read()))]
+    return _get_reversed(response, "sha")
 
 
 def get_gh_deployment(repository: str) -> str:
-    return get_gh_deployments(repository)[-1]
+    return get_gh_deployments(repository, 1)[-1]
 
 
 def _get_gl_repository_base(repository: str) -> tuple[str, str]:
     return _get_repository_base(repository, _DEFAULT_GL_BASE)
 
 
+@functools.lru_cache(maxsize=256)
 def _get_gl_repository(repository: str, base: str) -> int:
     if repository.isdigit():
         return int(repository)
-    else:
-        url = f"{base}/api/v4/projects/{repository.replace('/', '%2F')}"
-        response = _urlopen(url)
-        return json.loads(response.read())["id"]
+    key = f"gitlab-project {base} {repository}"
+    if (cached := _cache_get(key, _CACHE_TTL_GL_PROJECT)) is not None:
+        return int(cached)
+    url = f"{base}/api/v4/projects/{repository.replace('/', '%2F')}"
+    response = _urlopen(url)
+    project = json.loads(response.read())["id"]
+    _cache_put(key, str(project).encode())
+    return project
 
 
-def get_gl_commits(repository: str) -> list[str]:
+def get_gl_commits(repository: str, limit: int = _PER_PAGE) -> list[str]:
     repository, base = _get_gl_repository_base(repository)
     repository, branch = _get_repository_branch(repository)
-    url = f"{base}/api/v4/projects/{_get_gl_repository(repository, base)}/repository/commits?ref_name={branch}"
+    url = f"{base}/api/v4/projects/{_get_gl_repository(repository, base)}/repository/commits?ref_name={branch}&per_page={limit}"
     response = _urlopen(url)
-    return [result["id"] for result in reversed(json.loads(response.read()))]
+    return _get_reversed(response, "id")
 
 
 def get_gl_commit(repository: str) -> str:
-    return get_gl_commits(repository)[-1]
+    return get_gl_commits(repository, 1)[-1]
 
 
-def get_gl_tags(repository: str) -> list[str]:
+def get_gl_tags(repository: str, limit: int = _PER_PAGE) -> list[str]:
     repository, base = _get_gl_repository_base(repository)
-    url = f"{base}/api/v4/projects/{_get_gl_repository(repository, base)}/repository/tags?order_by=version"
+    url = f"{base}/api/v4/projects/{_get_gl_repository(repository, base)}/repository/tags?order_by=version&per_page={limit}"
     response = _urlopen(url)
-    return [result["name"] for result in reversed(json.loads(response.read()))]
+    return _get_reversed(response, "name")
 
 
 def get_gl_tag(repository: str) -> str:
-    return get_gl_tags(repository)[-1]
+    return get_gl_tags(repository, 1)[-1]
 
 
 def get_cron_tag(cron: str) -> str:
@@ -337,7 +592,7 @@ def get_ghcr_tags(repository: str, token: str) -> list[str]:
         url,
         headers=headers
     )
-    with urllib.request.urlopen(request) as response:
+    with urllib.request.urlopen(request, context=_SSL_CONTEXT) as response:
         data = json.loads(response.read())
 
     all_tags = []
@@ -348,8 +603,36 @@ def get_ghcr_tags(repository: str, token: str) -> list[str]:
 
     return all_tags
 
+def _get_tag(args: argparse.Namespace) -> str:
+    if args.pip:
+        return get_pip_version(args.pip)
+    elif args.npm:
+        return get_npm_version(args.npm)
+    elif args.go:
+        return get_go_version(args.go)
+    elif args.gh_commit:
+        return get_gh_commit(args.gh_commit)
+    elif args.gh_tag:
+        return get_gh_tag(args.gh_tag)
+    elif args.gh_release:
+        return get_gh_release(args.gh_release)
+    elif args.gh_deployment:
+        return get_gh_deployment(args.gh_deployment)
+    elif args.gl_commit:
+        return get_gl_commit(args.gl_commit)
+    elif args.gl_tag:
+        return get_gl_tag(args.gl_tag)
+    elif args.cr:
+        return get_cron_tag(args.cr)
+    else:
+        raise NotImplementedError
+
+
 def main():
-    parser = argparse.ArgumentParser()
+    parser = argparse.ArgumentParser(
+        epilog="Responses are cached for 5 minutes in $GET_TAG_CACHE "
+        "(default ~/.cache/get-tag); set it to an empty value to disable caching."
+    )
     parser.add_argument("docker_tag", default=os.environ.get("TAG_DOCKER"))
     group = parser.add_mutually_exclusive_group()
     group.add_argument("--pip", default=os.environ.get("TAG_PIP"))
@@ -363,35 +646,23 @@ def main():
     group.add_argument("--gl-tag", default=os.environ.get("TAG_GL_TAG"))
     parser.add_argument("--ghcr-token", help="GitHub Token for GHCR", default=os.environ.get("GHCR_TOKEN"))
     group.add_argument("--cr", default=os.environ.get("TAG_CR"), choices=_CR_COICES)
+    parser.add_argument(
+        "--no-docker-check",
+        action="store_true",
+        default=os.environ.get("TAG_NO_DOCKER_CHECK", "").lower()
+        in ("1", "true", "yes"),
+    )
     args = parser.parse_args()
 
-    if "ghcr.io" in args.docker_tag:
-        tags = get_ghcr_tags(args.docker_tag, args.ghcr_token)
-    else:
-        tags = get_docker_tags(args.docker_tag)
-        
-    if args.pip:
-        tag = get_pip_version(args.pip)
-    elif args.npm:
-        tag = get_npm_version(args.npm)
-    elif args.go:
-        tag = get_go_version(args.go)
-    elif args.gh_commit:
-        tag = get_gh_commit(args.gh_commit)
-    elif args.gh_tag:
-        tag = get_gh_tag(args.gh_tag)
-    elif args.gh_release:
-        tag = get_gh_release(args.gh_release)
-    elif args.gh_deployment:
-        tag = get_gh_deployment(args.gh_deployment)
-    elif args.gl_commit:
-        tag = get_gl_commit(args.gl_commit)
-    elif args.gl_tag:
-        tag = get_gl_tag(args.gl_tag)
-    elif args.cr:
-        tag = get_cron_tag(args.cr)
-    else:
-        raise NotImplementedError
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        future_tag = executor.submit(_get_tag, args)
+        if args.no_docker_check:
+            tags = []
+        elif "ghcr.io" in args.docker_tag:
+            tags = get_ghcr_tags(args.docker_tag, args.ghcr_token)
+        else:
+            tags = get_docker_tags(args.docker_tag)
+        tag = future_tag.result()
     if tag not in tags:
         print(f"tag={tag}")
 